@@ -1,8 +1,18 @@
+import datetime
+import struct
+import uuid
+
 import pytest
-from typing import Callable
+from typing import Any, Callable, Dict
+from typing_extensions import TypedDict
 from weaviate.connect import ConnectionV4
+from weaviate.collections.classes.internal import MetadataReturn, _QueryOptions
+from weaviate.collections.classes.types import GeoCoordinate, _PhoneNumber
 from weaviate.collections.query import _QueryCollection
 from weaviate.exceptions import WeaviateInvalidInputError
+from weaviate.proto.v1 import properties_pb2, search_get_pb2
+from weaviate.util import _ServerVersion
+from weaviate.warnings import _Warnings
 
 # TODO: re-enable tests once string syntax is re-enabled in the API
 
@@ -127,3 +137,335 @@ def test_bad_query_inputs(connection: ConnectionV4) -> None:
 
     # near image
     _test_query(lambda: query.near_image(42))
+
+
+def test_result_to_query_return_metadata(connection: ConnectionV4) -> None:
+    query = _QueryCollection(connection, "dummy", None, None, None, None, True)
+    res = search_get_pb2.SearchReply(
+        results=[
+            search_get_pb2.SearchResult(
+                metadata=search_get_pb2.MetadataResult(
+                    id_as_bytes=uuid.UUID(int=1).bytes,
+                    creation_time_unix=1700000000123,
+                    creation_time_unix_present=True,
+                    distance=0.5,
+                    distance_present=True,
+                    certainty=0.25,
+                    certainty_present=True,
+                    score=2.0,
+                    score_present=True,
+                    explain_score="explained",
+                    explain_score_present=True,
+                    is_consistent=True,
+                    is_consistent_present=True,
+                    rerank_score=3.0,
+                    rerank_score_present=True,
+                )
+            )
+        ]
+    )
+    options = _QueryOptions(True, True, True, True, False)
+
+    ret = query._result_to_query_return(res, options, None, None)
+
+    assert len(ret.objects) == 1
+    assert ret.objects[0].uuid == uuid.UUID(int=1)
+    assert ret.objects[0].metadata == MetadataReturn(
+        creation_time=datetime.datetime.fromtimestamp(1700000000.123, tz=datetime.timezone.utc),
+        last_update_time=None,
+        distance=0.5,
+        certainty=0.25,
+        score=2.0,
+        explain_score="explained",
+        is_consistent=True,
+        rerank_score=3.0,
+    )
+
+
+def test_parse_return_properties_from_collection_generic(connection: ConnectionV4) -> None:
+    class Props(TypedDict):
+        name: str
+        age: int
+
+    query = _QueryCollection(connection, "dummy", None, None, Props, None, True)
+
+    assert query._parse_return_properties(None) == ["name", "age"]
+    assert query._parse_return_properties(None) is query._parse_return_properties(None)
+    assert query._parse_return_properties(["other"]) == ["other"]
+
+
+def _search_result(id_: int, collection: str, generative: str = "") -> search_get_pb2.SearchResult:
+    return search_get_pb2.SearchResult(
+        properties=search_get_pb2.PropertiesResult(
+            non_ref_props=properties_pb2.Properties(
+                fields={"name": properties_pb2.Value(text_value=f"name{id_}")}
+            ),
+            ref_props=[
+                search_get_pb2.RefPropertiesResult(
+                    prop_name="ref",
+                    properties=[
+                        search_get_pb2.PropertiesResult(
+                            non_ref_props=properties_pb2.Properties(
+                                fields={"name": properties_pb2.Value(text_value="referenced")}
+                            ),
+                            target_collection="Referenced",
+                            metadata=search_get_pb2.MetadataResult(
+                                id_as_bytes=uuid.UUID(int=100).bytes
+                            ),
+                        )
+                    ],
+                )
+            ],
+            target_collection=collection,
+        ),
+        metadata=search_get_pb2.MetadataResult(
+            id_as_bytes=uuid.UUID(int=id_).bytes,
+            vector_bytes=struct.pack("<2f", 0.5, 1.5),
+            generative=generative,
+            generative_present=generative != "",
+        ),
+    )
+
+
+def _assert_object(obj, id_: int, collection: str) -> None:
+    assert obj.uuid == uuid.UUID(int=id_)
+    assert obj.properties == {"name": f"name{id_}"}
+    assert obj.vector == {"default": [0.5, 1.5]}
+    assert obj.collection == collection
+    assert list(obj.references.keys()) == ["ref"]
+    (ref,) = obj.references["ref"].objects
+    assert ref.uuid == uuid.UUID(int=100)
+    assert ref.properties == {"name": "referenced"}
+    assert ref.collection == "Referenced"
+
+
+def test_result_to_query_return_objects(connection: ConnectionV4) -> None:
+    query = _QueryCollection(connection, "dummy", None, None, None, None, True)
+    options = _QueryOptions(True, True, True, True, False)
+
+    ret = query._result_to_query_return(
+        search_get_pb2.SearchReply(results=[_search_result(1, "Collection")]), options, None, None
+    )
+    assert len(ret.objects) == 1
+    _assert_object(ret.objects[0], 1, "Collection")
+
+    ret = query._result_to_generative_query_return(
+        search_get_pb2.SearchReply(results=[_search_result(2, "Collection", "generated text")]),
+        options,
+        None,
+        None,
+    )
+    assert len(ret.objects) == 1
+    _assert_object(ret.objects[0], 2, "Collection")
+    assert ret.objects[0].generated == "generated text"
+
+
+def test_result_to_groupby_return_objects(connection: ConnectionV4) -> None:
+    query = _QueryCollection(connection, "dummy", None, None, None, None, True)
+    options = _QueryOptions(True, True, True, True, False)
+    res = search_get_pb2.SearchReply(
+        group_by_results=[
+            search_get_pb2.GroupByResult(
+                name="group1",
+                number_of_objects=2,
+                objects=[_search_result(1, "Collection"), _search_result(2, "Collection")],
+            ),
+            search_get_pb2.GroupByResult(
+                name="group2", number_of_objects=1, objects=[_search_result(3, "Other")]
+            ),
+        ]
+    )
+
+    ret = query._result_to_groupby_return(res, options, None, None)
+
+    assert list(ret.groups.keys()) == ["group1", "group2"]
+    assert [obj.uuid for obj in ret.objects] == [uuid.UUID(int=i) for i in (1, 2, 3)]
+    for obj, id_, collection, group in zip(
+        ret.objects,
+        (1, 2, 3),
+        ("Collection", "Collection", "Other"),
+        ("group1", "group1", "group2"),
+    ):
+        _assert_object(obj, id_, collection)
+        assert obj.belongs_to_group == group
+    assert ret.groups["group2"].objects[0].belongs_to_group == "group2"
+    assert ret.groups["group1"].number_of_objects == 2
+
+
+def _deserialize_properties(
+    connection: ConnectionV4, version: str, fields: Dict[str, properties_pb2.Value]
+) -> Dict[str, Any]:
+    connection._weaviate_version = _ServerVersion.from_string(version)
+    query = _QueryCollection(connection, "dummy", None, None, None, None, True)
+    res = search_get_pb2.SearchReply(
+        results=[
+            search_get_pb2.SearchResult(
+                properties=search_get_pb2.PropertiesResult(
+                    non_ref_props=properties_pb2.Properties(fields=fields)
+                ),
+                metadata=search_get_pb2.MetadataResult(id_as_bytes=uuid.UUID(int=1).bytes),
+            )
+        ]
+    )
+    ret = query._result_to_query_return(
+        res, _QueryOptions(False, True, False, False, False), None, None
+    )
+    return ret.objects[0].properties
+
+
+_UUID = uuid.UUID("12345678-1234-5678-1234-567812345678")
+_DATE = datetime.datetime(2023, 1, 2, 3, 4, 5, 123456, tzinfo=datetime.timezone.utc)
+_DATE_STR = "2023-01-02T03:04:05.123456Z"
+
+
+def test_deserialize_scalar_properties(connection: ConnectionV4) -> None:
+    phone = properties_pb2.PhoneNumber(
+        country_code=49,
+        default_country="DE",
+        input="0176 1234567",
+        international_formatted="+49 176 1234567",
+        national=1761234567,
+        national_formatted="0176 1234567",
+        valid=True,
+    )
+    props = _deserialize_properties(
+        connection,
+        "1.25.0",
+        {
+            "uuid": properties_pb2.Value(uuid_value=str(_UUID)),
+            "date": properties_pb2.Value(date_value=_DATE_STR),
+            "string": properties_pb2.Value(string_value="string"),
+            "text": properties_pb2.Value(text_value="text"),
+            "int": properties_pb2.Value(int_value=-(2**40)),
+            "number": properties_pb2.Value(number_value=1.5),
+            "bool": properties_pb2.Value(bool_value=True),
+            "geo": properties_pb2.Value(
+                geo_value=properties_pb2.GeoCoordinate(latitude=52.5, longitude=13.25)
+            ),
+            "blob": properties_pb2.Value(blob_value="YmxvYg=="),
+            "phone": properties_pb2.Value(phone_value=phone),
+            "null": properties_pb2.Value(null_value=0),
+            "object": properties_pb2.Value(
+                object_value=properties_pb2.Properties(
+                    fields={"nested": properties_pb2.Value(int_value=1)}
+                )
+            ),
+        },
+    )
+
+    assert props == {
+        "uuid": _UUID,
+        "date": _DATE,
+        "string": "string",
+        "text": "text",
+        "int": -(2**40),
+        "number": 1.5,
+        "bool": True,
+        "geo": GeoCoordinate(latitude=52.5, longitude=13.25),
+        "blob": "YmxvYg==",
+        "phone": _PhoneNumber(
+            country_code=49,
+            default_country="DE",
+            number="0176 1234567",
+            international_formatted="+49 176 1234567",
+            national=1761234567,
+            national_formatted="0176 1234567",
+            valid=True,
+        ),
+        "null": None,
+        "object": {"nested": 1},
+    }
+    assert isinstance(props["uuid"], uuid.UUID)
+
+
+def test_deserialize_list_properties_125(connection: ConnectionV4) -> None:
+    props = _deserialize_properties(
+        connection,
+        "1.25.0",
+        {
+            "bools": properties_pb2.Value(
+                list_value=properties_pb2.ListValue(
+                    bool_values=properties_pb2.BoolValues(values=[True, False])
+                )
+            ),
+            "dates": properties_pb2.Value(
+                list_value=properties_pb2.ListValue(
+                    date_values=properties_pb2.DateValues(values=[_DATE_STR])
+                )
+            ),
+            "ints": properties_pb2.Value(
+                list_value=properties_pb2.ListValue(
+                    int_values=properties_pb2.IntValues(values=struct.pack("<2q", -1, 2**40))
+                )
+            ),
+            "numbers": properties_pb2.Value(
+                list_value=properties_pb2.ListValue(
+                    number_values=properties_pb2.NumberValues(values=struct.pack("<2d", 0.5, -1.5))
+                )
+            ),
+            "texts": properties_pb2.Value(
+                list_value=properties_pb2.ListValue(
+                    text_values=properties_pb2.TextValues(values=["a", "b"])
+                )
+            ),
+            "uuids": properties_pb2.Value(
+                list_value=properties_pb2.ListValue(
+                    uuid_values=properties_pb2.UuidValues(values=[str(_UUID)])
+                )
+            ),
+            "objects": properties_pb2.Value(
+                list_value=properties_pb2.ListValue(
+                    object_values=properties_pb2.ObjectValues(
+                        values=[
+                            properties_pb2.Properties(
+                                fields={"nested": properties_pb2.Value(text_value="x")}
+                            )
+                        ]
+                    )
+                )
+            ),
+        },
+    )
+
+    assert props == {
+        "bools": [True, False],
+        "dates": [_DATE],
+        "ints": [-1, 2**40],
+        "numbers": [0.5, -1.5],
+        "texts": ["a", "b"],
+        "uuids": [_UUID],
+        "objects": [{"nested": "x"}],
+    }
+    assert all(type(value) is list for value in props.values())
+
+
+def test_deserialize_list_properties_124(connection: ConnectionV4) -> None:
+    props = _deserialize_properties(
+        connection,
+        "1.24.0",
+        {
+            "list": properties_pb2.Value(
+                list_value=properties_pb2.ListValue(
+                    values=[
+                        properties_pb2.Value(text_value="a"),
+                        properties_pb2.Value(int_value=1),
+                        properties_pb2.Value(date_value=_DATE_STR),
+                    ]
+                )
+            ),
+        },
+    )
+
+    assert props == {"list": ["a", 1, _DATE]}
+    assert type(props["list"]) is list
+
+
+def test_deserialize_list_without_kind_warns(connection: ConnectionV4) -> None:
+    _Warnings.reset_cache()
+    with pytest.warns(UserWarning, match="^Grpc002"):
+        props = _deserialize_properties(
+            connection,
+            "1.25.0",
+            {"empty": properties_pb2.Value(list_value=properties_pb2.ListValue())},
+        )
+    assert props == {"empty": None}
@@ -1,12 +1,23 @@
+import datetime
+import math
+import os
+import tempfile
 import unittest
 import uuid as uuid_lib
 from copy import deepcopy
+from typing import Union
 from unittest.mock import patch, Mock
+
+import httpx
 import pytest
+import requests
 
 from test.util import check_error_message
-from weaviate.exceptions import SchemaValidationException
+from weaviate.exceptions import ResponseCannotBeDecodedError, SchemaValidationException
 from weaviate.util import (
+    _decode_json_response_dict,
+    _decode_json_response_list,
+    _datetime_from_weaviate_str,
     generate_uuid5,
     image_decoder_b64,
     image_encoder_b64,
@@ -441,8 +452,8 @@ class TestUtil(unittest.TestCase):
             image_encoder_b64(True)
         check_error_message(self, error, type_error_message)
 
-        with self.assertRaises(TypeError) as error:
-            with open("image.png", "wb") as file:
+        with self.assertRaises(TypeError) as error, tempfile.TemporaryDirectory() as tmp_dir:
+            with open(os.path.join(tmp_dir, "image.png"), "wb") as file:
                 image_encoder_b64(file)
         check_error_message(self, error, type_error_message)
 
@@ -490,8 +501,8 @@ class TestUtil(unittest.TestCase):
             image_encoder_b64(True)
         check_error_message(self, error, type_error_message)
 
-        with self.assertRaises(TypeError) as error:
-            with open("image.png", "wb") as file:
+        with self.assertRaises(TypeError) as error, tempfile.TemporaryDirectory() as tmp_dir:
+            with open(os.path.join(tmp_dir, "image.png"), "wb") as file:
                 image_encoder_b64(file)
         check_error_message(self, error, type_error_message)
 
@@ -575,3 +586,126 @@ def test_is_weaviate_too_old(version: str, too_old: bool):
 )
 def test_is_weaviate_client_too_old(current_version: str, latest_version: str, too_old: bool):
     assert is_weaviate_client_too_old(current_version, latest_version) is too_old
+
+
+def _json_response(body: bytes, client: str) -> Union[requests.Response, httpx.Response]:
+    if client == "httpx":
+        return httpx.Response(200, content=body)
+    response = requests.Response()
+    response.status_code = 200
+    response._content = body
+    return response
+
+
+@pytest.fixture(params=["orjson", "json"])
+def json_backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> None:
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr("weaviate.util.orjson", None)
+
+
+@pytest.mark.parametrize("client", ["requests", "httpx"])
+@pytest.mark.parametrize(
+    "body,expected",
+    [
+        (
+            b'{"a": 1, "b": [1.5, "x", null, true], "c": {}}',
+            {"a": 1, "b": [1.5, "x", None, True], "c": {}},
+        ),
+        (
+            b'{"a": 18446744073709551616, "b": -9223372036854775809}',
+            {"a": 18446744073709551616, "b": -9223372036854775809},
+        ),
+        (b'{"a": 1e400, "b": -1e400}', {"a": math.inf, "b": -math.inf}),
+    ],
+)
+def test_decode_json_response_dict(json_backend: None, client: str, body: bytes, expected: dict):
+    result = _decode_json_response_dict(_json_response(body, client), "test")
+    assert result == expected
+    assert all(type(result[key]) is type(value) for key, value in expected.items())
+
+
+@pytest.mark.parametrize("client", ["requests", "httpx"])
+def test_decode_json_response_dict_nan(json_backend: None, client: str):
+    result = _decode_json_response_dict(_json_response(b'{"a": NaN}', client), "test")
+    assert result is not None and math.isnan(result["a"])
+
+
+@pytest.mark.parametrize("client", ["requests", "httpx"])
+def test_decode_json_response_list(json_backend: None, client: str):
+    body = b'[{"a": 1}, {"b": "\\u00fc"}]'
+    assert _decode_json_response_list(_json_response(body, client), "test") == [
+        {"a": 1},
+        {"b": "\u00fc"},
+    ]
+
+
+@pytest.mark.parametrize("client", ["requests", "httpx"])
+@pytest.mark.parametrize("body", [b"", b"not json", b'{"a": ', b'{"a": 1}}'])
+def test_decode_json_response_invalid(json_backend: None, client: str, body: bytes):
+    with pytest.raises(ResponseCannotBeDecodedError):
+        _decode_json_response_dict(_json_response(body, client), "test")
+    with pytest.raises(ResponseCannotBeDecodedError):
+        _decode_json_response_list(_json_response(body, client), "test")
+
+
+_UTC = datetime.timezone.utc
+
+
+@pytest.mark.parametrize(
+    "string,expected",
+    [
+        ("2023-01-02T03:04:05Z", datetime.datetime(2023, 1, 2, 3, 4, 5, tzinfo=_UTC)),
+        ("0001-01-01T00:00:00Z", datetime.datetime(1, 1, 1, tzinfo=_UTC)),
+        (
+            "2023-01-02T03:04:05+02:00",
+            datetime.datetime(
+                2023, 1, 2, 3, 4, 5, tzinfo=datetime.timezone(datetime.timedelta(hours=2))
+            ),
+        ),
+        (
+            "2023-01-02T03:04:05-05:30",
+            datetime.datetime(
+                2023,
+                1,
+                2,
+                3,
+                4,
+                5,
+                tzinfo=datetime.timezone(-datetime.timedelta(hours=5, minutes=30)),
+            ),
+        ),
+        ("2023-01-02T03:04:05+00:00", datetime.datetime(2023, 1, 2, 3, 4, 5, tzinfo=_UTC)),
+        ("2023-01-02T03:04:05.1Z", datetime.datetime(2023, 1, 2, 3, 4, 5, 100000, tzinfo=_UTC)),
+        ("2023-01-02T03:04:05.12Z", datetime.datetime(2023, 1, 2, 3, 4, 5, 120000, tzinfo=_UTC)),
+        ("2023-01-02T03:04:05.123Z", datetime.datetime(2023, 1, 2, 3, 4, 5, 123000, tzinfo=_UTC)),
+        ("2023-01-02T03:04:05.1234Z", datetime.datetime(2023, 1, 2, 3, 4, 5, 123400, tzinfo=_UTC)),
+        ("2023-01-02T03:04:05.12345Z", datetime.datetime(2023, 1, 2, 3, 4, 5, 123450, tzinfo=_UTC)),
+        (
+            "2023-01-02T03:04:05.123456+01:00",
+            datetime.datetime(
+                2023, 1, 2, 3, 4, 5, 123456, tzinfo=datetime.timezone(datetime.timedelta(hours=1))
+            ),
+        ),
+    ],
+)
+def test_datetime_from_weaviate_str(string: str, expected: datetime.datetime):
+    result = _datetime_from_weaviate_str(string)
+    assert result == expected
+    assert result.utcoffset() == expected.utcoffset()
+
+
+@pytest.mark.parametrize(
+    "string",
+    [
+        "2023-01-02T03:04:05",
+        "2023-01-02T03:04:05.123456",
+        "2023-01-02",
+        "2023-W01-1T00:00:00Z",
+        "2023-01-02T03:04:05.123456789Z",
+    ],
+)
+def test_datetime_from_weaviate_str_invalid(string: str):
+    with pytest.raises(ValueError):
+        _datetime_from_weaviate_str(string)
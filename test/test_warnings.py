@@ -0,0 +1,95 @@
+import warnings
+from typing import Callable
+
+import pytest
+
+import weaviate.warnings
+from weaviate.warnings import _Warnings, _client_version, _ignored
+
+
+def test_weaviate_too_old_vs_latest_warns_once_per_version():
+    _Warnings.reset_cache()
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter("always")
+        _Warnings.weaviate_too_old_vs_latest("1.10.0")
+        _Warnings.weaviate_too_old_vs_latest("1.10.0")
+        _Warnings.weaviate_too_old_vs_latest("1.11.0")
+        assert [str(x.message)[:6] for x in w] == ["Dep004", "Dep004"]
+
+        _Warnings.reset_cache()
+        _Warnings.weaviate_too_old_vs_latest("1.10.0")
+        assert len(w) == 3
+
+
+def test_weaviate_too_old_vs_latest_ignored_first_call_does_not_suppress():
+    _Warnings.reset_cache()
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter("ignore")
+        _Warnings.weaviate_too_old_vs_latest("1.10.0")
+        warnings.simplefilter("always")
+        _Warnings.weaviate_too_old_vs_latest("1.10.0")
+        assert len(w) == 1
+
+
+def test_unknown_type_encountered_warns_once_per_field():
+    _Warnings.reset_cache()
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter("always")
+        for _ in range(3):
+            _Warnings.unknown_type_encountered("a")
+        _Warnings.unknown_type_encountered("b")
+        assert [str(x.message)[:7] for x in w] == ["Grpc002", "Grpc002"]
+
+        _Warnings.reset_cache()
+        _Warnings.unknown_type_encountered("a")
+        assert len(w) == 3
+
+
+def test_unknown_type_encountered_ignored_first_call_does_not_suppress():
+    _Warnings.reset_cache()
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter("ignore")
+        _Warnings.unknown_type_encountered("a")
+        warnings.simplefilter("always")
+        _Warnings.unknown_type_encountered("a")
+        assert len(w) == 1
+
+
+@pytest.mark.parametrize(
+    "install_filters,ignored",
+    [
+        (lambda: warnings.filterwarnings("ignore", category=UserWarning), True),
+        (lambda: warnings.simplefilter("ignore"), True),
+        (lambda: warnings.filterwarnings("ignore", category=Warning), True),
+        (lambda: warnings.filterwarnings("ignore", category=UserWarning, module="weaviate"), False),
+        (lambda: warnings.filterwarnings("ignore", message="Bat003", category=UserWarning), False),
+        (lambda: warnings.filterwarnings("ignore", category=UserWarning, lineno=1), False),
+        (lambda: warnings.filterwarnings("error", category=UserWarning), False),
+        (lambda: warnings.simplefilter("always"), False),
+        (lambda: warnings.filterwarnings("ignore", category=DeprecationWarning), False),
+        (lambda: None, False),
+    ],
+)
+def test_ignored(install_filters: Callable[[], None], ignored: bool):
+    with warnings.catch_warnings():
+        warnings.resetwarnings()
+        install_filters()
+        assert _ignored(UserWarning) is ignored
+
+
+def test_ignored_uses_first_matching_filter():
+    with warnings.catch_warnings():
+        warnings.resetwarnings()
+        warnings.simplefilter("ignore")
+        warnings.filterwarnings("error", category=UserWarning)  # inserted in front, so it wins
+        assert _ignored(UserWarning) is False
+        assert _ignored(DeprecationWarning) is True
+
+        warnings.filterwarnings("ignore", category=UserWarning)
+        assert _ignored(UserWarning) is True
+
+
+def test_version_is_stored_as_module_global_on_first_access():
+    vars(weaviate.warnings).pop("__version__", None)
+    assert weaviate.warnings.__version__ == _client_version()
+    assert vars(weaviate.warnings)["__version__"] == _client_version()
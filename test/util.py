@@ -1,3 +1,4 @@
+import json
 from typing import Union, Callable, Optional
 from unittest.mock import Mock
 
@@ -69,6 +70,8 @@ def mock_connection_func(
             rest_method_return_mock = Mock()
             # mock the json() method and set its return value
             rest_method_return_mock.json.return_value = return_json
+            # and the raw body, which is parsed directly when orjson is installed
+            rest_method_return_mock.content = json.dumps(return_json).encode()
             # Set status code
             rest_method_return_mock.configure_mock(status_code=status_code)
             # set the return value of the given REST method
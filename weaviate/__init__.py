@@ -3,13 +3,11 @@ Weaviate Python Client Library used to interact with a Weaviate instance.
 """
 
 import sys
-from importlib.metadata import version, PackageNotFoundError
 from typing import Any
 
-try:
-    __version__ = version("weaviate-client")
-except PackageNotFoundError:
-    __version__ = "unknown version"
+from .warnings import _client_version
+
+__version__ = _client_version()
 
 from .client import Client, WeaviateClient
 from .connect.helpers import (
@@ -11,7 +11,7 @@ from weaviate.collections.classes.config import ConsistencyLevel
 from weaviate.collections.classes.filters import _Filters
 from weaviate.collections.filters import _FilterToGRPC
 from weaviate.collections.grpc.shared import _BaseGRPC
-from weaviate.collections.queries.base import _WeaviateUUIDInt
+from weaviate.collections.queries.base import _uuid_from_bytes
 from weaviate.connect import ConnectionV4
 from weaviate.exceptions import WeaviateDeleteManyError
 from weaviate.proto.v1 import batch_delete_pb2
@@ -46,7 +46,7 @@ class _BatchDeleteGRPC(_BaseGRPC):
             if verbose:
                 objects: List[DeleteManyObject] = [
                     DeleteManyObject(
-                        uuid=_WeaviateUUIDInt(int.from_bytes(obj.uuid, byteorder="big")),
+                        uuid=_uuid_from_bytes(obj.uuid),
                         successful=obj.successful,
                         error=obj.error if obj.error != "" else None,
                     )
@@ -3,7 +3,7 @@ import io
 import os
 import pathlib
 import uuid as uuid_lib
-from typing import Any, Dict, Generic, List, Optional, Sequence, Type, Union, cast
+from typing import Any, Callable, Dict, Generic, List, Optional, Sequence, Type, Union, cast
 
 from typing_extensions import is_typeddict
 
@@ -68,6 +68,63 @@ class _WeaviateUUIDInt(uuid_lib.UUID):
         object.__setattr__(self, "int", hex_)
 
 
+def _uuid_from_bytes(bytes_: bytes) -> uuid_lib.UUID:
+    # The server always sends the 16 big-endian bytes of a valid UUID, so both the argument
+    # validation of uuid.UUID(bytes=...) and the __init__ call of _WeaviateUUIDInt can be skipped.
+    uuid = object.__new__(_WeaviateUUIDInt)
+    object.__setattr__(uuid, "int", int.from_bytes(bytes_, "big"))
+    return uuid
+
+
+def _deserialize_phone_value(value: properties_pb2.Value) -> _PhoneNumber:
+    phone = value.phone_value
+    return _PhoneNumber(
+        country_code=phone.country_code,
+        default_country=phone.default_country,
+        international_formatted=phone.international_formatted,
+        national=phone.national,
+        national_formatted=phone.national_formatted,
+        number=phone.input,
+        valid=phone.valid,
+    )
+
+
+# maps the name of the set field of the `kind` oneof to its deserializer so that a value can be
+# decoded with a single WhichOneof call instead of probing every field with HasField.
+# list_value and object_value need the query instance and are handled in _BaseQuery itself.
+_NON_REF_VALUE_DESERIALIZERS: Dict[str, Callable[[properties_pb2.Value], Any]] = {
+    "uuid_value": lambda value: uuid_lib.UUID(value.uuid_value),
+    "date_value": lambda value: _datetime_from_weaviate_str(value.date_value),
+    "string_value": lambda value: value.string_value,
+    "text_value": lambda value: value.text_value,
+    "int_value": lambda value: value.int_value,
+    "number_value": lambda value: value.number_value,
+    "bool_value": lambda value: value.bool_value,
+    "geo_value": lambda value: GeoCoordinate(
+        latitude=value.geo_value.latitude, longitude=value.geo_value.longitude
+    ),
+    "blob_value": lambda value: value.blob_value,
+    "phone_value": _deserialize_phone_value,
+    "null_value": lambda value: None,
+}
+
+
+# same as above for the typed lists of the 1.25+ API, object_values is handled in _BaseQuery.
+# Slicing a repeated field copies it into a plain list faster than list() does.
+_LIST_VALUE_DESERIALIZERS: Dict[str, Callable[[properties_pb2.ListValue], List[Any]]] = {
+    "bool_values": lambda value: value.bool_values.values[:],
+    "date_values": lambda value: list(map(_datetime_from_weaviate_str, value.date_values.values)),
+    "int_values": lambda value: _ByteOps.decode_int64s(value.int_values.values),
+    "number_values": lambda value: _ByteOps.decode_float64s(value.number_values.values),
+    "text_values": lambda value: value.text_values.values[:],
+    "uuid_values": lambda value: list(map(uuid_lib.UUID, value.uuid_values.values)),
+}
+
+
+# referenced objects are always returned with everything the server sent for them
+_REFERENCE_QUERY_OPTIONS = _QueryOptions(True, True, True, True, False)
+
+
 class _BaseQuery(Generic[Properties, References]):
     def __init__(
         self,
@@ -86,8 +143,17 @@ class _BaseQuery(Generic[Properties, References]):
         self._properties = properties
         self._references = references
         self._validate_arguments = validate_arguments
+        # the collection-specific generics never change, so their properties and references are
+        # extracted on first use instead of introspecting the TypedDicts on every query
+        self.__data_model_properties: Optional[PROPERTIES] = None
+        self.__data_model_references: Optional[REFERENCES] = None
 
         self.__uses_125_api = self._connection._weaviate_version.is_at_least(1, 25, 0)
+        self.__deserialize_list_value_prop = (
+            self.__deserialize_list_value_prop_125
+            if self.__uses_125_api
+            else self.__deserialize_list_value_prop_123
+        )
         self._query = _QueryGRPC(
             self._connection,
             self._name,
@@ -101,69 +167,60 @@ class _BaseQuery(Generic[Properties, References]):
         self,
         timestamp: int,
     ) -> datetime.datetime:
-        # Handle the case in which last_update_time_unix is in nanoseconds or milliseconds, issue #958
-        if len(str(timestamp)) <= 13:
-            return datetime.datetime.fromtimestamp(timestamp / 1000, tz=datetime.timezone.utc)
+        # Handle the case in which last_update_time_unix is in nanoseconds or milliseconds, issue #958.
+        # Millisecond timestamps have at most 13 digits, compare numerically instead of via str().
+        if timestamp < 10_000_000_000_000:
+            return datetime.datetime.fromtimestamp(timestamp / 1000, datetime.timezone.utc)
         else:
-            return datetime.datetime.fromtimestamp(timestamp / 1e9, tz=datetime.timezone.utc)
+            return datetime.datetime.fromtimestamp(timestamp / 1e9, datetime.timezone.utc)
 
     def __extract_metadata_for_object(
         self,
         add_props: "search_get_pb2.MetadataResult",
     ) -> MetadataReturn:
-        meta = MetadataReturn(
-            distance=add_props.distance if add_props.distance_present else None,
-            certainty=add_props.certainty if add_props.certainty_present else None,
-            creation_time=(
+        # positional arguments in the field order of MetadataReturn, which is roughly twice as fast
+        # as passing eight keyword arguments to the dataclass __init__
+        return MetadataReturn(
+            (
                 self.__retrieve_timestamp(add_props.creation_time_unix)
                 if add_props.creation_time_unix_present
                 else None
             ),
-            last_update_time=(
+            (
                 self.__retrieve_timestamp(add_props.last_update_time_unix)
                 if add_props.last_update_time_unix_present
                 else None
             ),
-            score=add_props.score if add_props.score_present else None,
-            explain_score=add_props.explain_score if add_props.explain_score_present else None,
-            is_consistent=add_props.is_consistent if add_props.is_consistent_present else None,
-            rerank_score=add_props.rerank_score if add_props.rerank_score_present else None,
+            add_props.distance if add_props.distance_present else None,
+            add_props.certainty if add_props.certainty_present else None,
+            add_props.score if add_props.score_present else None,
+            add_props.explain_score if add_props.explain_score_present else None,
+            add_props.is_consistent if add_props.is_consistent_present else None,
+            add_props.rerank_score if add_props.rerank_score_present else None,
         )
-        return meta
 
     def __extract_metadata_for_group_by_object(
         self,
         add_props: "search_get_pb2.MetadataResult",
     ) -> GroupByMetadataReturn:
-        meta = GroupByMetadataReturn(
-            distance=add_props.distance if add_props.distance_present else None,
-        )
-        return meta
+        return GroupByMetadataReturn(add_props.distance if add_props.distance_present else None)
 
     def __extract_id_for_object(
         self,
         add_props: "search_get_pb2.MetadataResult",
     ) -> uuid_lib.UUID:
-        return _WeaviateUUIDInt(int.from_bytes(add_props.id_as_bytes, byteorder="big"))
+        return _uuid_from_bytes(add_props.id_as_bytes)
 
     def __extract_vector_for_object(
         self,
         add_props: "search_get_pb2.MetadataResult",
     ) -> Dict[str, List[float]]:
-        if (
-            len(add_props.vector_bytes) == 0
-            and len(add_props.vector) == 0
-            and len(add_props.vectors) == 0
-        ):
-            return {}
-
-        if len(add_props.vector_bytes) > 0:
-            return {"default": _ByteOps.decode_float32s(add_props.vector_bytes)}
+        # every access of a bytes field copies it out of the message, so read it only once
+        vector_bytes = add_props.vector_bytes
+        if len(vector_bytes) > 0:
+            return {"default": _ByteOps.decode_float32s(vector_bytes)}
 
-        vecs = {}
-        for vec in add_props.vectors:
-            vecs[vec.name] = _ByteOps.decode_float32s(vec.vector_bytes)
-        return vecs
+        return {vec.name: _ByteOps.decode_float32s(vec.vector_bytes) for vec in add_props.vectors}
 
     def __extract_generated_for_object(
         self,
@@ -174,99 +231,70 @@ class _BaseQuery(Generic[Properties, References]):
     def __deserialize_list_value_prop_125(
         self, value: properties_pb2.ListValue
     ) -> Optional[List[Any]]:
-        if value.HasField("bool_values"):
-            return list(value.bool_values.values)
-        if value.HasField("date_values"):
-            return [_datetime_from_weaviate_str(val) for val in value.date_values.values]
-        if value.HasField("int_values"):
-            return _ByteOps.decode_int64s(value.int_values.values)
-        if value.HasField("number_values"):
-            return _ByteOps.decode_float64s(value.number_values.values)
-        if value.HasField("text_values"):
-            return list(value.text_values.values)
-        if value.HasField("uuid_values"):
-            return [uuid_lib.UUID(val) for val in value.uuid_values.values]
-        if value.HasField("object_values"):
-            return [
-                self.__parse_nonref_properties_result(val) for val in value.object_values.values
-            ]
-        _Warnings.unknown_type_encountered(value.WhichOneof("Value"))
+        kind = value.WhichOneof("kind")
+        if kind == "object_values":
+            return list(map(self.__parse_nonref_properties_result, value.object_values.values))
+
+        deserializer = _LIST_VALUE_DESERIALIZERS.get(kind)
+        if deserializer is not None:
+            return deserializer(value)
+
+        _Warnings.unknown_type_encountered(str(kind))
         return None
 
     def __deserialize_list_value_prop_123(self, value: properties_pb2.ListValue) -> List[Any]:
-        return [self.__deserialize_non_ref_prop(val) for val in value.values]
+        return list(map(self.__deserialize_non_ref_prop, value.values))
 
     def __deserialize_non_ref_prop(self, value: properties_pb2.Value) -> Any:
-        if value.HasField("uuid_value"):
-            return uuid_lib.UUID(value.uuid_value)
-        if value.HasField("date_value"):
-            return _datetime_from_weaviate_str(value.date_value)
-        if value.HasField("string_value"):
-            return str(value.string_value)
-        if value.HasField("text_value"):
-            return str(value.text_value)
-        if value.HasField("int_value"):
-            return int(value.int_value)
-        if value.HasField("number_value"):
-            return float(value.number_value)
-        if value.HasField("bool_value"):
-            return bool(value.bool_value)
-        if value.HasField("list_value"):
-            return (
-                self.__deserialize_list_value_prop_125(value.list_value)
-                if self.__uses_125_api
-                else self.__deserialize_list_value_prop_123(value.list_value)
-            )
-        if value.HasField("object_value"):
+        kind = value.WhichOneof("kind")
+        if kind == "list_value":
+            return self.__deserialize_list_value_prop(value.list_value)
+        if kind == "object_value":
             return self.__parse_nonref_properties_result(value.object_value)
-        if value.HasField("geo_value"):
-            return GeoCoordinate(
-                latitude=value.geo_value.latitude, longitude=value.geo_value.longitude
-            )
-        if value.HasField("blob_value"):
-            return value.blob_value
-        if value.HasField("phone_value"):
-            return _PhoneNumber(
-                country_code=value.phone_value.country_code,
-                default_country=value.phone_value.default_country,
-                international_formatted=value.phone_value.international_formatted,
-                national=value.phone_value.national,
-                national_formatted=value.phone_value.national_formatted,
-                number=value.phone_value.input,
-                valid=value.phone_value.valid,
-            )
-        if value.HasField("null_value"):
-            return None
 
-        _Warnings.unknown_type_encountered(value.WhichOneof("Value"))
+        deserializer = _NON_REF_VALUE_DESERIALIZERS.get(kind)
+        if deserializer is not None:
+            return deserializer(value)
+
+        _Warnings.unknown_type_encountered(str(kind))
         return None
 
     def __parse_nonref_properties_result(
         self,
         properties: properties_pb2.Properties,
     ) -> dict:
-        return {
-            name: self.__deserialize_non_ref_prop(value)
-            for name, value in properties.fields.items()
-        }
+        # Scalar values are decoded inline to save a method call per field, only nested lists and
+        # objects go through __deserialize_non_ref_prop. The map is iterated by key because
+        # .items() on a protobuf map container falls back to the pure-Python ItemsView.
+        deserialize_non_ref_prop = self.__deserialize_non_ref_prop
+        deserializers = _NON_REF_VALUE_DESERIALIZERS
+        fields = properties.fields
+        result = {}
+        for name in fields:
+            value = fields[name]
+            deserializer = deserializers.get(value.WhichOneof("kind"))
+            result[name] = (
+                deserializer(value) if deserializer is not None else deserialize_non_ref_prop(value)
+            )
+        return result
 
     def __parse_ref_properties_result(
         self,
         properties: search_get_pb2.PropertiesResult,
     ) -> Optional[dict]:
-        if len(properties.ref_props) == 0:
+        ref_props = properties.ref_props
+        if len(ref_props) == 0:
             return {} if properties.ref_props_requested else None
 
+        result_to_query_object = self.__result_to_query_object
         return {
             ref_prop.prop_name: _CrossReference._from(
                 [
-                    self.__result_to_query_object(
-                        prop, prop.metadata, _QueryOptions(True, True, True, True, False)
-                    )
+                    result_to_query_object(prop, prop.metadata, _REFERENCE_QUERY_OPTIONS)
                     for prop in ref_prop.properties
                 ]
             )
-            for ref_prop in properties.ref_props
+            for ref_prop in ref_props
         }
 
     def __result_to_query_object(
@@ -275,23 +303,22 @@ class _BaseQuery(Generic[Properties, References]):
         meta: search_get_pb2.MetadataResult,
         options: _QueryOptions,
     ) -> Object[Any, Any]:
+        # leading fields in the field order of _Object, the str fields by keyword so they cannot be swapped
         return Object(
-            collection=props.target_collection,
-            properties=(
-                self.__parse_nonref_properties_result(props.non_ref_props)
-                if options.include_properties
-                else {}
-            ),
-            metadata=(
+            self.__extract_id_for_object(meta),
+            (
                 self.__extract_metadata_for_object(meta)
                 if options.include_metadata
                 else MetadataReturn()
             ),
-            references=(
-                self.__parse_ref_properties_result(props) if options.include_references else None
+            (
+                self.__parse_nonref_properties_result(props.non_ref_props)
+                if options.include_properties
+                else {}
             ),
-            uuid=self.__extract_id_for_object(meta),
-            vector=self.__extract_vector_for_object(meta) if options.include_vector else {},
+            self.__parse_ref_properties_result(props) if options.include_references else None,
+            self.__extract_vector_for_object(meta) if options.include_vector else {},
+            collection=props.target_collection,
         )
 
     def __result_to_generative_object(
@@ -301,22 +328,20 @@ class _BaseQuery(Generic[Properties, References]):
         options: _QueryOptions,
     ) -> GenerativeObject[Any, Any]:
         return GenerativeObject(
-            collection=props.target_collection,
-            properties=(
-                self.__parse_nonref_properties_result(props.non_ref_props)
-                if options.include_properties
-                else {}
-            ),
-            metadata=(
+            self.__extract_id_for_object(meta),
+            (
                 self.__extract_metadata_for_object(meta)
                 if options.include_metadata
                 else MetadataReturn()
             ),
-            references=(
-                self.__parse_ref_properties_result(props) if options.include_references else None
+            (
+                self.__parse_nonref_properties_result(props.non_ref_props)
+                if options.include_properties
+                else {}
             ),
-            uuid=self.__extract_id_for_object(meta),
-            vector=self.__extract_vector_for_object(meta) if options.include_vector else {},
+            self.__parse_ref_properties_result(props) if options.include_references else None,
+            self.__extract_vector_for_object(meta) if options.include_vector else {},
+            collection=props.target_collection,
             generated=self.__extract_generated_for_object(meta),
         )
 
@@ -325,12 +350,15 @@ class _BaseQuery(Generic[Properties, References]):
         res: search_get_pb2.GroupByResult,
         options: _QueryOptions,
     ) -> Group[Any, Any]:
+        # string fields are copied out of the message on every access, so read the name only once
+        name = res.name
+        result_to_group_by_object = self.__result_to_group_by_object
         return Group(
             objects=[
-                self.__result_to_group_by_object(obj.properties, obj.metadata, options, res.name)
+                result_to_group_by_object(obj.properties, obj.metadata, options, name)
                 for obj in res.objects
             ],
-            name=res.name,
+            name=name,
             number_of_objects=res.number_of_objects,
             min_distance=res.min_distance,
             max_distance=res.max_distance,
@@ -342,12 +370,14 @@ class _BaseQuery(Generic[Properties, References]):
         res: search_get_pb2.GroupByResult,
         options: _QueryOptions,
     ) -> GenerativeGroup[Any, Any]:
+        name = res.name
+        result_to_group_by_object = self.__result_to_group_by_object
         return GenerativeGroup(
             objects=[
-                self.__result_to_group_by_object(obj.properties, obj.metadata, options, res.name)
+                result_to_group_by_object(obj.properties, obj.metadata, options, name)
                 for obj in res.objects
             ],
-            name=res.name,
+            name=name,
             number_of_objects=res.number_of_objects,
             min_distance=res.min_distance,
             max_distance=res.max_distance,
@@ -363,22 +393,20 @@ class _BaseQuery(Generic[Properties, References]):
         group_name: str,
     ) -> GroupByObject[Any, Any]:
         return GroupByObject(
-            collection=props.target_collection,
-            properties=(
-                self.__parse_nonref_properties_result(props.non_ref_props)
-                if options.include_properties
-                else {}
-            ),
-            metadata=(
+            self.__extract_id_for_object(meta),
+            (
                 self.__extract_metadata_for_group_by_object(meta)
                 if options.include_metadata
                 else GroupByMetadataReturn()
             ),
-            references=(
-                self.__parse_ref_properties_result(props) if options.include_references else None
+            (
+                self.__parse_nonref_properties_result(props.non_ref_props)
+                if options.include_properties
+                else {}
             ),
-            uuid=self.__extract_id_for_object(meta),
-            vector=self.__extract_vector_for_object(meta) if options.include_vector else {},
+            self.__parse_ref_properties_result(props) if options.include_references else None,
+            self.__extract_vector_for_object(meta) if options.include_vector else {},
+            collection=props.target_collection,
             belongs_to_group=group_name,
         )
 
@@ -400,10 +428,10 @@ class _BaseQuery(Generic[Properties, References]):
         QueryReturn[TProperties, CrossReferences],
         QueryReturn[TProperties, TReferences],
     ]:
+        result_to_query_object = self.__result_to_query_object
         return QueryReturn(
             objects=[
-                self.__result_to_query_object(obj.properties, obj.metadata, options)
-                for obj in res.results
+                result_to_query_object(obj.properties, obj.metadata, options) for obj in res.results
             ]
         )
 
@@ -425,9 +453,10 @@ class _BaseQuery(Generic[Properties, References]):
         GenerativeReturn[TProperties, CrossReferences],
         GenerativeReturn[TProperties, TReferences],
     ]:
+        result_to_generative_object = self.__result_to_generative_object
         return GenerativeReturn(
             objects=[
-                self.__result_to_generative_object(obj.properties, obj.metadata, options)
+                result_to_generative_object(obj.properties, obj.metadata, options)
                 for obj in res.results
             ],
             generated=(
@@ -463,12 +492,11 @@ class _BaseQuery(Generic[Properties, References]):
             ReturnReferences[TReferences]
         ],  # required until 3.12 is minimum supported version to use new generics syntax
     ) -> GroupByReturnType[Properties, References, TProperties, TReferences]:
-        groups = {
-            group.name: self.__result_to_group(group, options) for group in res.group_by_results
-        }
-        objects_group_by: List[GroupByObject] = [
-            obj for group in groups.values() for obj in group.objects
-        ]
+        result_to_group = self.__result_to_group
+        groups = {group.name: result_to_group(group, options) for group in res.group_by_results}
+        objects_group_by: List[GroupByObject] = []
+        for group in groups.values():
+            objects_group_by.extend(group.objects)
         return GroupByReturn(objects=objects_group_by, groups=groups)
 
     def _result_to_generative_groupby_return(
@@ -489,23 +517,13 @@ class _BaseQuery(Generic[Properties, References]):
         GenerativeGroupByReturn[TProperties, CrossReferences],
         GenerativeGroupByReturn[TProperties, TReferences],
     ]:
+        result_to_generative_group = self.__result_to_generative_group
         groups = {
-            group.name: self.__result_to_generative_group(group, options)
-            for group in res.group_by_results
+            group.name: result_to_generative_group(group, options) for group in res.group_by_results
         }
-        objects_group_by: List[GroupByObject] = [
-            GroupByObject(
-                collection=obj.collection,
-                properties=obj.properties,
-                references=obj.references,
-                metadata=obj.metadata,
-                belongs_to_group=group.name,
-                uuid=obj.uuid,
-                vector=obj.vector,
-            )
-            for group in groups.values()
-            for obj in group.objects
-        ]
+        objects_group_by: List[GroupByObject] = []
+        for group in groups.values():
+            objects_group_by.extend(group.objects)
         return GenerativeGroupByReturn(
             objects=objects_group_by,
             groups=groups,
@@ -551,9 +569,11 @@ class _BaseQuery(Generic[Properties, References]):
         elif return_properties is None and self._properties is not None:
             if not is_typeddict(self._properties):
                 return return_properties
-            return _extract_properties_from_data_model(
-                self._properties
-            )  # is sourced from collection-specific generic
+            if self.__data_model_properties is None:
+                self.__data_model_properties = _extract_properties_from_data_model(
+                    self._properties
+                )  # is sourced from collection-specific generic
+            return self.__data_model_properties
         else:
             assert return_properties is not None
             if not is_typeddict(return_properties):
@@ -597,8 +617,9 @@ class _BaseQuery(Generic[Properties, References]):
         elif return_references is None and self._references is not None:
             if not is_typeddict(self._references):
                 return return_references
-            refs = _extract_references_from_data_model(self._references)
-            return refs
+            if self.__data_model_references is None:
+                self.__data_model_references = _extract_references_from_data_model(self._references)
+            return self.__data_model_references
         else:
             assert return_references is not None
             if not is_typeddict(return_references):
@@ -35,7 +35,7 @@ from weaviate.util import (
     PYPI_PACKAGE_URL,
     _decode_json_response_dict,
 )
-from weaviate.warnings import _Warnings
+from weaviate.warnings import _Warnings, _ignored
 
 from .base import _ConnectionBase, _get_proxies
 
@@ -169,14 +169,16 @@ class Connection(_ConnectionBase):
         if is_weaviate_too_old(self._server_version):
             _Warnings.weaviate_too_old_vs_latest(self._server_version)
 
-        try:
-            pkg_info = requests.get(PYPI_PACKAGE_URL, timeout=INIT_CHECK_TIMEOUT).json()
-            pkg_info = pkg_info.get("info", {})
-            latest_version = pkg_info.get("version", "unknown version")
-            if is_weaviate_client_too_old(client_version, latest_version):
-                _Warnings.weaviate_client_too_old_vs_latest(client_version, latest_version)
-        except requests.exceptions.RequestException:
-            pass  # ignore any errors related to requests, it is a best-effort warning
+        # the PyPI lookup only feeds a DeprecationWarning, don't make the request if it would be dropped
+        if not _ignored(DeprecationWarning):
+            try:
+                pkg_info = requests.get(PYPI_PACKAGE_URL, timeout=INIT_CHECK_TIMEOUT).json()
+                pkg_info = pkg_info.get("info", {})
+                latest_version = pkg_info.get("version", "unknown version")
+                if is_weaviate_client_too_old(client_version, latest_version):
+                    _Warnings.weaviate_client_too_old_vs_latest(client_version, latest_version)
+            except requests.exceptions.RequestException:
+                pass  # ignore any errors related to requests, it is a best-effort warning
 
         if embedded_db is not None:
             self.wait_for_weaviate(10)
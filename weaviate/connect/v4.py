@@ -60,7 +60,7 @@ from weaviate.util import (
     _ServerVersion,
 )
 from weaviate.validator import _ValidateArgument, _validate_input
-from weaviate.warnings import _Warnings
+from weaviate.warnings import _Warnings, _ignored
 
 Session = Union[Client, OAuth2Client]
 AsyncSession = Union[AsyncClient, AsyncOAuth2Client]
@@ -151,7 +151,8 @@ class _Connection(_ConnectionBase):
         except (WeaviateConnectionError, ReadError, RemoteProtocolError) as e:
             raise WeaviateStartUpError(f"Could not connect to Weaviate:{e}.") from e
 
-        if not skip_init_checks:
+        # the PyPI lookup only feeds a DeprecationWarning, don't make the request if it would be dropped
+        if not skip_init_checks and not _ignored(DeprecationWarning):
             try:
                 pkg_info = get(PYPI_PACKAGE_URL, timeout=self.timeout_config.init).json()
                 pkg_info = pkg_info.get("info", {})
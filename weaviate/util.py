@@ -8,7 +8,9 @@ import io
 import json
 import os
 import re
+import sys
 from enum import Enum, EnumMeta
+from functools import lru_cache
 from pathlib import Path
 from typing import Union, Sequence, Any, Optional, List, Dict, Generator, Tuple, cast
 
@@ -28,6 +30,14 @@ from weaviate.exceptions import (
 from weaviate.warnings import _Warnings
 from weaviate.types import NUMBER, UUIDS, TIME
 
+try:  # optional, installed with the "fast-json" extra
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+# any integer orjson could turn into a float has at least 19 digits
+_LONG_DIGIT_RUN = re.compile(rb"\d{19,}")
+
 PYPI_PACKAGE_URL = "https://pypi.org/pypi/weaviate-client/json"
 MAXIMUM_MINOR_VERSION_DELTA = 3  # The maximum delta between minor versions of Weaviate Client that will not trigger an upgrade warning.
 MINIMUM_NO_WARNING_VERSION = (
@@ -599,6 +609,7 @@ def generate_uuid5(identifier: Any, namespace: Any = "") -> str:
     return str(uuid_lib.uuid5(uuid_lib.NAMESPACE_DNS, str(namespace) + str(identifier)))
 
 
+@lru_cache(maxsize=1024)
 def _capitalize_first_letter(string: str) -> str:
     """
     Capitalize only the first letter of the `string`.
@@ -927,6 +938,23 @@ def _to_beacons(uuids: UUIDS, to_class: str = "") -> List[Dict[str, str]]:
     return [{"beacon": f"weaviate://localhost/{to_class}{uuid_to}"} for uuid_to in uuids]
 
 
+def _response_json(response: Union[httpx.Response, requests.Response]) -> Any:
+    """Parse the JSON body of a response, using orjson on the raw bytes if it is installed.
+
+    orjson rejects NaN, Infinity and floats out of range and turns integers wider than 64 bits into floats. Bodies
+    that orjson cannot parse or that contain a long run of digits are therefore parsed by response.json(), so the
+    result is the same with and without orjson.
+    """
+    if orjson is not None:
+        content = response.content
+        if _LONG_DIGIT_RUN.search(content) is None:
+            try:
+                return orjson.loads(content)
+            except orjson.JSONDecodeError:
+                pass
+    return response.json()
+
+
 def _decode_json_response_dict(
     response: Union[httpx.Response, requests.Response], location: str
 ) -> Optional[Dict[str, Any]]:
@@ -935,9 +963,9 @@ def _decode_json_response_dict(
 
     if 200 <= response.status_code < 300:
         try:
-            json_response = cast(Dict[str, Any], response.json())
+            json_response = cast(Dict[str, Any], _response_json(response))
             return json_response
-        except JSONDecodeError:
+        except (json.JSONDecodeError, JSONDecodeError):
             raise ResponseCannotBeDecodedError(location, response)
 
     raise UnexpectedStatusCodeError(location, response)
@@ -951,9 +979,9 @@ def _decode_json_response_list(
 
     if 200 <= response.status_code < 300:
         try:
-            json_response = response.json()
+            json_response = _response_json(response)
             return cast(list, json_response)
-        except JSONDecodeError:
+        except (json.JSONDecodeError, JSONDecodeError):
             raise ResponseCannotBeDecodedError(location, response)
     raise UnexpectedStatusCodeError(location, response)
 
@@ -965,14 +993,22 @@ def _datetime_to_string(value: TIME) -> str:
     return value.isoformat(sep="T", timespec="microseconds")
 
 
+_RFC3339_DATETIME = re.compile(
+    r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d{1,6})?(Z|[+-]\d{2}:\d{2})"
+)
+
+
 def _datetime_from_weaviate_str(string: str) -> datetime.datetime:
+    if sys.version_info >= (3, 11) and _RFC3339_DATETIME.fullmatch(string) is not None:
+        # fromisoformat understands RFC 3339 (including "Z") from 3.11 on and is implemented in C, which is much
+        # faster than strptime for date-heavy query results. It also accepts many other ISO 8601 forms, so it is
+        # only used for strings the strptime formats below accept as well.
+        result = datetime.datetime.fromisoformat(string)
+        if result.tzinfo is not None:
+            return result
+
+    string = "".join(string.rsplit(":", 1) if string[-1] != "Z" else string)
     try:
-        return datetime.datetime.strptime(
-            "".join(string.rsplit(":", 1) if string[-1] != "Z" else string),
-            "%Y-%m-%dT%H:%M:%S.%f%z",
-        )
+        return datetime.datetime.strptime(string, "%Y-%m-%dT%H:%M:%S.%f%z")
     except ValueError:  # if the string does not have microseconds
-        return datetime.datetime.strptime(
-            "".join(string.rsplit(":", 1) if string[-1] != "Z" else string),
-            "%Y-%m-%dT%H:%M:%S%z",
-        )
+        return datetime.datetime.strptime(string, "%Y-%m-%dT%H:%M:%S%z")
@@ -20,6 +20,8 @@ def _validate_input(inputs: Union[List[_ValidateArgument], _ValidateArgument]) -
     if isinstance(inputs, _ValidateArgument):
         inputs = [inputs]
     for validate in inputs:
+        if validate.value is None and None in validate.expected:
+            continue  # unset optional arguments are the most common case, skip the type checks
         if not any(__is_valid(exp, validate.value) for exp in validate.expected):
             raise WeaviateInvalidInputError(
                 f"Argument '{validate.name}' must be one of: {validate.expected}, but got {type(validate.value)}"
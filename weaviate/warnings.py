@@ -1,22 +1,74 @@
+import threading
 import warnings
 from datetime import datetime
+from functools import lru_cache
 from importlib.metadata import version, PackageNotFoundError
-from typing import Optional
+from typing import Any, Optional, Set, Tuple, Type
 
-try:
-    __version__ = version("weaviate-client")
-except PackageNotFoundError:
-    __version__ = "unknown version"
+__version__: str  # looked up on first access, see __getattr__ below
+
+
+@lru_cache(maxsize=None)
+def _client_version() -> str:
+    try:
+        return version("weaviate-client")
+    except PackageNotFoundError:
+        return "unknown version"
+
+
+def __getattr__(name: str) -> Any:
+    if name == "__version__":
+        global __version__
+        __version__ = _client_version()
+        return __version__
+    raise AttributeError(f"module {__name__} has no attribute {name}")
+
+
+# warnings that can fire for every returned object or every new connection are only emitted once per
+# (method, arguments)
+_emitted: Set[Tuple[str, Tuple[Any, ...]]] = set()
+_emitted_lock = threading.Lock()
+
+
+def _first_emit(key: Tuple[str, Tuple[Any, ...]]) -> bool:
+    if key in _emitted:
+        return False
+    with _emitted_lock:
+        if key in _emitted:
+            return False
+        _emitted.add(key)
+        return True
+
+
+def _ignored(category: Type[Warning]) -> bool:
+    """Whether the active filters drop every warning of this category, so its message need not be built.
+
+    Filters that depend on the message or the calling module are left to warnings.warn to decide.
+    """
+    for action, message, cat, module, lineno in warnings.filters:
+        if issubclass(category, cat):
+            if message is None and module is None and lineno == 0:
+                return action == "ignore"
+            return False
+    return False
 
 
 class _Warnings:
+    @staticmethod
+    def reset_cache() -> None:
+        """Forget which of the deduplicated warnings have already been emitted."""
+        with _emitted_lock:
+            _emitted.clear()
+
     @staticmethod
     def auth_with_anon_weaviate() -> None:
         warnings.warn(
-            message="""Auth001: The client is configured to use authentication, but weaviate is configured without
-                    authentication. Are you sure this is correct?""",
+            message=(
+                "Auth001: The client is configured to use authentication, but weaviate is configured without\n"
+                "authentication. Are you sure this is correct?"
+            ),
             category=UserWarning,
-            stacklevel=1,
+            stacklevel=2,
         )
 
     @staticmethod
@@ -27,125 +79,152 @@ class _Warnings:
             msg = "Also, no expiration time was given."
 
         warnings.warn(
-            message=f"""Auth002: The token your identity provider returned does not contain a refresh token. {msg}
-
-            Access to your weaviate instance is not possible after the token expires. This client returns an
-            authentication exception.
-
-            Things to try:
-            - You might need to enable refresh tokens in your authentication provider settings.
-            - You might need to send the correct scope. For some providers, the scope needs to include "offline_access".
-            """,
+            message=(
+                f"Auth002: The token your identity provider returned does not contain a refresh token. {msg}\n"
+                "\n"
+                "Access to your weaviate instance is not possible after the token expires. This client returns an\n"
+                "authentication exception.\n"
+                "\n"
+                "Things to try:\n"
+                "- You might need to enable refresh tokens in your authentication provider settings.\n"
+                '- You might need to send the correct scope. For some providers, the scope needs to include "offline_access".'
+            ),
             category=UserWarning,
-            stacklevel=1,
+            stacklevel=2,
         )
 
     @staticmethod
     def auth_negative_expiration_time(expires_in: int) -> None:
-        msg = f"""Auth003: Access token expiration time is negative: {expires_in}."""
+        msg = f"Auth003: Access token expiration time is negative: {expires_in}."
 
-        warnings.warn(message=msg, category=UserWarning, stacklevel=1)
+        warnings.warn(message=msg, category=UserWarning, stacklevel=2)
 
     @staticmethod
     def auth_header_and_auth_secret() -> None:
-        msg = """Auth004: Received an authentication header and an auth_client_secret parameter.
-
-        The auth_client_secret takes precedence over the header. The authentication header will be ignored.
-
-        Use weaviate.auth.AuthBearerToken(..) to supply an access token via auth_client_secret parameter and,
-        if available with your provider, to supply refresh tokens and token lifetimes.
-        """
-        warnings.warn(message=msg, category=UserWarning, stacklevel=1)
+        msg = (
+            "Auth004: Received an authentication header and an auth_client_secret parameter.\n"
+            "\n"
+            "The auth_client_secret takes precedence over the header. The authentication header will be ignored.\n"
+            "\n"
+            "Use weaviate.auth.AuthBearerToken(..) to supply an access token via auth_client_secret parameter and,\n"
+            "if available with your provider, to supply refresh tokens and token lifetimes."
+        )
+        warnings.warn(message=msg, category=UserWarning, stacklevel=2)
 
     @staticmethod
     def auth_cannot_parse_oidc_config(url: str) -> None:
-        msg = f"""Auth005: Could not parse Weaviate's OIDC configuration, using unauthenticated access. If you added
-        an authorization header yourself it will be unaffected.
-
-        This can happen if weaviate is miss-configured or if you have a proxy between the client and weaviate.
-        You can test this by visiting {url}."""
-        warnings.warn(message=msg, category=UserWarning, stacklevel=1)
+        msg = (
+            "Auth005: Could not parse Weaviate's OIDC configuration, using unauthenticated access. If you added\n"
+            "an authorization header yourself it will be unaffected.\n"
+            "\n"
+            "This can happen if weaviate is miss-configured or if you have a proxy between the client and weaviate.\n"
+            f"You can test this by visiting {url}."
+        )
+        warnings.warn(message=msg, category=UserWarning, stacklevel=2)
 
     @staticmethod
     def weaviate_server_older_than_1_14(server_version: str) -> None:
         warnings.warn(
-            message=f"""Dep001: You are using Weaviate Python Client version {__version__}. This version supports
-            changes and features of Weaviate >=1.14.x, but you are connected to Weaviate {server_version}.
-
-            To use this Python Client with the new features, upgrade your
-            Weaviate instance.""",
+            message=(
+                f"Dep001: You are using Weaviate Python Client version {_client_version()}. This version supports\n"
+                f"changes and features of Weaviate >=1.14.x, but you are connected to Weaviate {server_version}.\n"
+                "\n"
+                "To use this Python Client with the new features, upgrade your\n"
+                "Weaviate instance."
+            ),
             category=DeprecationWarning,
-            stacklevel=1,
+            stacklevel=2,
         )
 
     @staticmethod
     def manual_batching() -> None:
         warnings.warn(
-            message="""Dep002: Manual batching does NOT use the client's built-in multi-threading. Set
-            `batch_size` in `client.batch.configure()` to an integer value to enabled automatic
-            batching. See:
-            https://weaviate.io/developers/weaviate/current/restful-api-references/batch.html#example-request-1""",
+            message=(
+                "Dep002: Manual batching does NOT use the client's built-in multi-threading. Set\n"
+                "`batch_size` in `client.batch.configure()` to an integer value to enabled automatic\n"
+                "batching. See:\n"
+                "https://weaviate.io/developers/weaviate/current/restful-api-references/batch.html#example-request-1"
+            ),
             category=DeprecationWarning,
-            stacklevel=1,
+            stacklevel=2,
         )
 
     @staticmethod
     def weaviate_too_old_for_openai(server_version: str) -> None:
         warnings.warn(
-            message=f"""Dep003: You are trying to use the generative search, but you are connected to Weaviate {server_version}.
-            Support for generative search was added in weaviate version 1.17.3.""",
+            message=(
+                f"Dep003: You are trying to use the generative search, but you are connected to Weaviate {server_version}.\n"
+                "Support for generative search was added in weaviate version 1.17.3."
+            ),
             category=DeprecationWarning,
-            stacklevel=1,
+            stacklevel=2,
         )
 
     @staticmethod
     def startup_period_deprecated() -> None:
         warnings.warn(
-            message="""Dep004: startup_period is deprecated and has no effect.""",
+            message="Dep004: startup_period is deprecated and has no effect.",
             category=DeprecationWarning,
-            stacklevel=1,
+            stacklevel=2,
         )
 
     @staticmethod
     def token_refresh_failed(exc: Exception) -> None:
+        if _ignored(UserWarning):
+            return
         warnings.warn(
-            message=f"""Con001: Could not reach token issuer for the periodic refresh. This client will automatically
-            retry to refresh. If the retry does not succeed, the client will become unauthenticated.
-
-            The cause might be an unstable internet connection or a problem with your authentication provider.
-            Exception: {exc}
-            """,
+            message=(
+                "Con001: Could not reach token issuer for the periodic refresh. This client will automatically\n"
+                "retry to refresh. If the retry does not succeed, the client will become unauthenticated.\n"
+                "\n"
+                "The cause might be an unstable internet connection or a problem with your authentication provider.\n"
+                f"Exception: {exc}"
+            ),
             category=UserWarning,
-            stacklevel=1,
+            stacklevel=2,
         )
 
     @staticmethod
     def weaviate_too_old_vs_latest(server_version: str) -> None:
+        if _ignored(DeprecationWarning):
+            return
+        if not _first_emit(("weaviate_too_old_vs_latest", (server_version,))):
+            return
         warnings.warn(
-            message=f"""Dep004: You are connected to Weaviate {server_version}.
-            Consider upgrading to the latest version. See https://www.weaviate.io/developers/weaviate for details.""",
+            message=(
+                f"Dep004: You are connected to Weaviate {server_version}.\n"
+                "Consider upgrading to the latest version. See https://www.weaviate.io/developers/weaviate for details."
+            ),
             category=DeprecationWarning,
-            stacklevel=1,
+            stacklevel=2,
         )
 
     @staticmethod
     def weaviate_client_too_old_vs_latest(client_version: str, latest_version: str) -> None:
+        if _ignored(DeprecationWarning):
+            return
+        if not _first_emit(("weaviate_client_too_old_vs_latest", (client_version, latest_version))):
+            return
         warnings.warn(
-            message=f"""Dep005: You are using weaviate-client version {client_version}. The latest version is {latest_version}.
-            Consider upgrading to the latest version. See https://weaviate.io/developers/weaviate/client-libraries/python for details.""",
+            message=(
+                f"Dep005: You are using weaviate-client version {client_version}. The latest version is {latest_version}.\n"
+                "Consider upgrading to the latest version. See https://weaviate.io/developers/weaviate/client-libraries/python for details."
+            ),
             category=DeprecationWarning,
-            stacklevel=1,
+            stacklevel=2,
         )
 
     @staticmethod
     def use_of_client_batch_will_be_removed_in_next_major_release() -> None:
         warnings.warn(
-            message="""Dep006: You are using the `client.batch()` method. This method will be removed in the next major release.
-            Use the `client.batch.configure()` method to configure your batch process, and `client.batch` to enter the context manager.
-
-            See https://weaviate.io/developers/weaviate/client-libraries/python for details.""",
+            message=(
+                "Dep006: You are using the `client.batch()` method. This method will be removed in the next major release.\n"
+                "Use the `client.batch.configure()` method to configure your batch process, and `client.batch` to enter the context manager.\n"
+                "\n"
+                "See https://weaviate.io/developers/weaviate/client-libraries/python for details."
+            ),
             category=DeprecationWarning,
-            stacklevel=1,
+            stacklevel=2,
         )
 
     @staticmethod
@@ -160,114 +239,133 @@ class _Warnings:
     @staticmethod
     def weaviate_v3_client_is_deprecated() -> None:
         warnings.warn(
-            message="""Dep016: Python client v3 `weaviate.Client(...)` connections and methods are deprecated. Update
-            your code to use Python client v4 `weaviate.WeaviateClient` connections and methods.
-
-            For Python Client v4 usage, see: https://weaviate.io/developers/weaviate/client-libraries/python
-            For code migration, see: https://weaviate.io/developers/weaviate/client-libraries/python/v3_v4_migration
-            """,
+            message=(
+                "Dep016: Python client v3 `weaviate.Client(...)` connections and methods are deprecated. Update\n"
+                "your code to use Python client v4 `weaviate.WeaviateClient` connections and methods.\n"
+                "\n"
+                "For Python Client v4 usage, see: https://weaviate.io/developers/weaviate/client-libraries/python\n"
+                "For code migration, see: https://weaviate.io/developers/weaviate/client-libraries/python/v3_v4_migration"
+            ),
             category=DeprecationWarning,
-            stacklevel=1,
+            stacklevel=2,
         )
 
     @staticmethod
     def vector_index_config_in_config_update() -> None:
         warnings.warn(
-            message="""Dep017: You are using the `vector_index_config` argument in the `collection.config.update()` method, which is deprecated.
-            Use the `vectorizer_config` argument instead.
-            """,
+            message=(
+                "Dep017: You are using the `vector_index_config` argument in the `collection.config.update()` method, which is deprecated.\n"
+                "Use the `vectorizer_config` argument instead."
+            ),
             category=DeprecationWarning,
-            stacklevel=1,
+            stacklevel=2,
         )
 
     @staticmethod
     def sharding_actual_count_is_deprecated(argument: str) -> None:
         warnings.warn(
-            message=f"""Dep018: You are using the {argument} argument in the `Configure.sharding` method, which is deprecated.
-            This field is read-only, the argument has no effect. It will be removed in a future release.""",
+            message=(
+                f"Dep018: You are using the {argument} argument in the `Configure.sharding` method, which is deprecated.\n"
+                "This field is read-only, the argument has no effect. It will be removed in a future release."
+            ),
             category=DeprecationWarning,
-            stacklevel=1,
+            stacklevel=2,
         )
 
     @staticmethod
     def bit_compression_in_pq_config() -> None:
         warnings.warn(
-            message="""Dep019: The `bit_compression` argument in `PQConfig` is deprecated and will be removed by Q4 2024.""",
+            message="Dep019: The `bit_compression` argument in `PQConfig` is deprecated and will be removed by Q4 2024.",
             category=DeprecationWarning,
-            stacklevel=1,
+            stacklevel=2,
         )
 
     @staticmethod
     def datetime_insertion_with_no_specified_timezone(date: datetime) -> None:
+        if _ignored(UserWarning):
+            return
         warnings.warn(
-            message=f"""Con002: You are inserting the datetime object {date} without a timezone. The timezone will be set to UTC.
-            To use a different timezone, specify it in the datetime object. For example:
-            datetime.datetime(2021, 1, 1, 0, 0, 0, tzinfo=datetime.timezone(-datetime.timedelta(hours=2))).isoformat() = 2021-01-01T00:00:00-02:00
-            """,
+            message=(
+                f"Con002: You are inserting the datetime object {date} without a timezone. The timezone will be set to UTC.\n"
+                "To use a different timezone, specify it in the datetime object. For example:\n"
+                "datetime.datetime(2021, 1, 1, 0, 0, 0, tzinfo=datetime.timezone(-datetime.timedelta(hours=2))).isoformat() = 2021-01-01T00:00:00-02:00"
+            ),
             category=UserWarning,
-            stacklevel=1,
+            stacklevel=2,
         )
 
     @staticmethod
     def text2vec_huggingface_endpoint_url_and_model_set_together() -> None:
         warnings.warn(
-            message="""Con003: You are setting the endpoint_url alongside model or passage_model and
-            query_model in your Text2Vec-HuggingFace module configuration. The model definitions will
-            be ignored in favour of endpoint_url.
-            """,
+            message=(
+                "Con003: You are setting the endpoint_url alongside model or passage_model and\n"
+                "query_model in your Text2Vec-HuggingFace module configuration. The model definitions will\n"
+                "be ignored in favour of endpoint_url."
+            ),
             category=UserWarning,
-            stacklevel=1,
+            stacklevel=2,
         )
 
     @staticmethod
     def batch_executor_is_shutdown() -> None:
         warnings.warn(
-            message="""Bat001: The BatchExecutor was shutdown, most probably when it exited the `with` statement.
-                It will be initialized again. If you use `batch` outside the `with client.batch as batch` context,
-                shut down `batch` when the data import finishes: `client.batch.shutdown()`.
-                To start `batch` again, use the `client.batch.start()` method.""",
+            message=(
+                "Bat001: The BatchExecutor was shutdown, most probably when it exited the `with` statement.\n"
+                "It will be initialized again. If you use `batch` outside the `with client.batch as batch` context,\n"
+                "shut down `batch` when the data import finishes: `client.batch.shutdown()`.\n"
+                "To start `batch` again, use the `client.batch.start()` method."
+            ),
             category=UserWarning,
-            stacklevel=1,
+            stacklevel=2,
         )
 
     @staticmethod
     def batch_weaviate_overloaded_sleeping(sleep: int) -> None:
         warnings.warn(
-            message=f"""Bat002: Weaviate is currently overloaded. Sleeping for {sleep} seconds.""",
+            message=f"Bat002: Weaviate is currently overloaded. Sleeping for {sleep} seconds.",
             category=UserWarning,
-            stacklevel=1,
+            stacklevel=2,
         )
 
     @staticmethod
     def batch_refresh_failed(err: str) -> None:
+        if _ignored(UserWarning):
+            return
         warnings.warn(
-            message=f"""Bat003: The dynamic batch-size could not be refreshed successfully: error {err}""",
+            message=f"Bat003: The dynamic batch-size could not be refreshed successfully: error {err}",
             category=UserWarning,
-            stacklevel=1,
+            stacklevel=2,
         )
 
     @staticmethod
     def batch_retrying_failed_batches_hit_hard_limit(limit: int) -> None:
         warnings.warn(
-            message=f"""Bat004: Attempts to retry failed objects or references have hit the hard limit of {limit}.
-            The failed objects or references can be accessed in client.collections.batch.failed_objects and client.collections.batch.failed_references.""",
+            message=(
+                f"Bat004: Attempts to retry failed objects or references have hit the hard limit of {limit}.\n"
+                "The failed objects or references can be accessed in client.collections.batch.failed_objects and client.collections.batch.failed_references."
+            ),
             category=UserWarning,
-            stacklevel=1,
+            stacklevel=2,
         )
 
     @staticmethod
     def batch_rate_limit_reached(msg: str, seconds: int) -> None:
+        if _ignored(UserWarning):
+            return
         warnings.warn(
-            message=f"""Bat005: Rate limit reached with error {msg}.
-            Sleeping for {seconds} seconds.""",
+            message=f"Bat005: Rate limit reached with error {msg}.\nSleeping for {seconds} seconds.",
             category=UserWarning,
-            stacklevel=1,
+            stacklevel=2,
         )
 
     @staticmethod
     def unknown_type_encountered(field: str) -> None:
+        if _ignored(UserWarning):
+            return
+        if not _first_emit(("unknown_type_encountered", (field,))):
+            return
         warnings.warn(
-            message=f"""Grpc002: Unknown return type {field} received, skipping value and returning None.""",
+            message=f"Grpc002: Unknown return type {field} received, skipping value and returning None.",
             category=UserWarning,
-            stacklevel=1,
+            stacklevel=2,
         )